@@ -15,6 +15,25 @@ Example usage:
 """
 
 from .session import initiate_session
-from .cloudwatch import *
-from .s3 import *
+from .cloudwatch import (
+    LogCatalog,
+    get_all_log_streams,
+    get_events,
+    get_latest_stream,
+    iter_events,
+    log_events,
+    log_groups_stats,
+    update_logs,
+)
+from .s3 import (
+    s3_list_objects,
+    s3_object_size,
+    s3_object_sizes_df,
+    s3_read_csv,
+    s3_read_csv_table,
+    s3_read_json,
+    s3_read_json_to_df,
+    s3_upload_csv,
+    s3_upload_json,
+)
 from .cognito import CognitoUser
\ No newline at end of file
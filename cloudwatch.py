@@ -1,4 +1,18 @@
-import pandas as pd
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
+
+# pandas is only imported lazily at runtime; make it available to type
+# checkers and annotation introspection (e.g. typing.get_type_hints)
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Maximum number of concurrent CloudWatch requests
+# Must not exceed the max_pool_connections of the botocore client config
+MAX_WORKERS = 32
 
 # Get the log streams, handling pagination using nextToken
 def get_all_log_streams(cloudwatch, log_group_name):
@@ -37,98 +51,232 @@ def update_logs(cloudwatch, log_groups, verbose=False):
         # Add the strem information to the log groups dictionary
         log_groups[k]['log_streams'] = get_all_log_streams(cloudwatch, log_group_name)
 
-    # List all groups and all streams
+    # Build a flat list of (group, stream name) tasks across all groups
+    tasks = [
+        (group, stream['logStreamName'])
+        for group in log_groups
+        for stream in log_groups[group]['log_streams']
+    ]
+
+    # Create a list of event rows per group
+    group_rows = defaultdict(list)
+
+    # Fetch the streams concurrently; the workload is network-bound and the
+    # boto3 client is safe to share across threads
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(
+                get_events,
+                cloudwatch,
+                log_groups[group]['log_group_name'],
+                stream_name
+            ): (group, stream_name)
+            for group, stream_name in tasks
+        }
+
+        for future in as_completed(futures):
+            group, stream_name = futures[future]
+            log_err, events = future.result()
+
+            # Add the events to the group row list, tagged with their stream name
+            if log_err == 0:
+                group_rows[group].extend(
+                    {
+                        'timestamp': e['timestamp'],
+                        'message': e['message'],
+                        'stream': stream_name
+                    }
+                    for e in events
+                )
+
+    # pandas is imported lazily so auth-only callers never pay its import cost
+    import pandas as pd
+
+    # Add events as a single DataFrame to each log group dictionary
     for group in log_groups:
 
         if verbose:
             print(group)
+            print(len(log_groups[group]['log_streams']), 'streams found.')
 
-        # Create an empty list to store the log group events df
-        events_logs_dfs = []
+        events_df = pd.DataFrame(
+            group_rows[group],
+            columns=['timestamp', 'message', 'stream']
+        )
 
-        for stream in log_groups[group]['log_streams']:
+        # Convert the raw millisecond timestamps to datetime once for the
+        # whole group, using the vectorized path
+        events_df['timestamp'] = pd.to_datetime(events_df['timestamp'], unit='ms', cache=True, utc=True)
 
-            # Retrieve log events for the selected log group and stream
-            log_err, events = get_events(
-                cloudwatch,
-                log_groups[group]['log_group_name'],
-                stream['logStreamName']
-                )
-            
-            # Add the events to the df list
-            if log_err == 0:
-                events_logs_dfs.append(pd.DataFrame(events)[['timestamp', 'message']])
-                events_logs_dfs[-1]['stream'] = stream['logStreamName']  # include stream name
+        # The stream name repeats for every event in a stream; a categorical
+        # stores integer codes plus a small codebook instead of one string
+        # pointer per row
+        events_df['stream'] = events_df['stream'].astype('category')
 
-        if verbose:
-            print(len(events_logs_dfs), 'streams found.')
-
-        # Add events as a single DataFrame to the log group dictionary
-        log_groups[group]['events'] = pd.concat(events_logs_dfs).reset_index(drop=True)
+        log_groups[group]['events'] = events_df
 
     return log_groups
 
 
-def log_groups_stats(log_groups):
-    # Create an empty list to store the information
-    logs_info = []
+@dataclass
+class LogCatalog:
+    '''
+    Columnar view of a log_groups dictionary.
 
-    for k in log_groups:
-        logs_info.append(
-            {
-                'feature': k,
-                'log_group': log_groups[k]['log_group_name'],
-                'nb_streams': len(log_groups[k]['log_streams'])
-            }
+    Holds the per-feature group names and the per-stream metadata as two
+    DataFrames, so lookups and statistics are vectorized pandas operations
+    instead of per-feature Python loops over nested dictionaries.
+    '''
+
+    groups_df: pd.DataFrame
+    streams_df: pd.DataFrame
+
+    @classmethod
+    def from_log_groups(cls, log_groups: dict):
+        '''
+        Build a catalog from the {feature: {...}} dictionary used by update_logs
+        '''
+        import pandas as pd
+
+        # One row per feature
+        groups_df = pd.DataFrame(
+            [
+                {'feature': k, 'log_group_name': v['log_group_name']}
+                for k, v in log_groups.items()
+            ],
+            columns=['feature', 'log_group_name']
         )
 
-    # Store info in DataFrame
-    logs_info_df = pd.DataFrame(logs_info)
+        # One row per stream, tagged with its feature
+        streams_df = pd.DataFrame(
+            [
+                {
+                    'feature': k,
+                    'logStreamName': s['logStreamName'],
+                    'firstEventTimestamp': s.get('firstEventTimestamp'),
+                    'lastEventTimestamp': s.get('lastEventTimestamp')
+                }
+                for k, v in log_groups.items()
+                for s in v['log_streams']
+            ],
+            columns=['feature', 'logStreamName', 'firstEventTimestamp', 'lastEventTimestamp']
+        )
 
-    # Get the latest stream name for each feature
-    logs_info_df['latest_stream'] = logs_info_df['feature'].apply(lambda x: get_latest_stream(log_groups, x))
+        return cls(groups_df=groups_df, streams_df=streams_df)
+
+    def latest_streams(self) -> pd.DataFrame:
+        '''
+        Return one row per feature for the stream with the most recent event
+        '''
+        latest = self.streams_df.loc[
+            self.streams_df.groupby('feature')['lastEventTimestamp'].idxmax()
+        ]
+        return latest.reset_index(drop=True)
+
+    def stats(self) -> pd.DataFrame:
+        '''
+        Return the same summary as log_groups_stats, computed with vectorized
+        groupby operations
+        '''
+        nb_streams = self.streams_df.groupby('feature').size().rename('nb_streams')
+        latest_stream = self.latest_streams().set_index('feature')['logStreamName'].rename('latest_stream')
+
+        return (
+            self.groups_df
+            .set_index('feature')
+            .rename(columns={'log_group_name': 'log_group'})
+            .join([nb_streams, latest_stream])
+            .reset_index()
+        )
+
+
+def log_groups_stats(log_groups):
+    import pandas as pd
+
+    # Gather the information for all features, including the latest stream
+    # name, so the DataFrame is built once from fully-populated dictionaries
+    logs_info = [
+        {
+            'feature': k,
+            'log_group': log_groups[k]['log_group_name'],
+            'nb_streams': len(log_groups[k]['log_streams']),
+            'latest_stream': get_latest_stream(log_groups, k)
+        }
+        for k in log_groups
+    ]
 
-    return logs_info_df
+    # Store info in DataFrame
+    return pd.DataFrame(logs_info)
 
 
 def get_latest_stream(log_groups: dict, feature: str):
     '''
     Return the latest stream for a given feature, based on the timestamp
     '''
-    # Get all streams in a DataFrame
-    streams_df = pd.DataFrame(log_groups[feature]['log_streams'])
+    # Return the stream name for the most recent (max) timestamp in a single
+    # pass over the list of stream dictionaries
+    return max(
+        log_groups[feature]['log_streams'],
+        key=lambda s: s['lastEventTimestamp']
+    )['logStreamName']
+
+def iter_events(cloudwatch, log_group_name, log_stream_name):
+    '''
+    Yield all log events from a stream, handling pagination using nextForwardToken
+    '''
+
+    next_token = None
+
+    while True:
+        # Get a page of log stream events
+        if next_token:
+            response = cloudwatch.get_log_events(
+                logGroupName=log_group_name,
+                logStreamName=log_stream_name,
+                startFromHead=True,  # Set to True to get log events in the order they occurred
+                nextToken=next_token
+            )
+        else:
+            response = cloudwatch.get_log_events(
+                logGroupName=log_group_name,
+                logStreamName=log_stream_name,
+                startFromHead=True
+            )
 
-    # Return the stream name for the most recent (max) timestamp
-    return streams_df.loc[streams_df['lastEventTimestamp'] == streams_df['lastEventTimestamp'].max()]['stream_name'].values[0]
+        yield from response['events']
+
+        # The last page returns the same forward token, if so, stop the loop
+        if response['nextForwardToken'] == next_token:
+            break
+        next_token = response['nextForwardToken']
 
 def get_events(cloudwatch, log_group_name, log_stream_name):
     '''
-    Start CloudWatch Logs session and retrieve log events from the stream
+    Start CloudWatch Logs session and retrieve all log events from the stream
     '''
 
-    # Get log stream events
-    events = cloudwatch.get_log_events(
-        logGroupName=log_group_name,
-        logStreamName=log_stream_name,
-        startFromHead=True  # Set to True to get log events in the order they occurred
-    )
-
-    # Get status code from API request
-    status = events['ResponseMetadata']['HTTPStatusCode']
+    # Collect all pages of log stream events
+    events = list(iter_events(cloudwatch, log_group_name, log_stream_name))
 
-    if status == 200:
-        return (0, events['events'])
-    else:
-        return (-1, f"Request returned with status code {status}")
+    return (0, events)
     
 def log_events(cloudwatch, logs_info_df, feature: str):
     '''
     Retrieve the log events for a specific feature
+
+    Callers looping over many features can pass logs_info_df already indexed
+    by feature (set_index('feature')) to skip the per-call re-indexing.
     '''
+    import pandas as pd
+
+    # Index by feature once so the lookups below are O(1) scalar .at accesses
+    # instead of full boolean scans of the DataFrame
+    if logs_info_df.index.name != 'feature':
+        logs_info_df = logs_info_df.set_index('feature')
 
     # Get the log group and latest stream for the selected feature
-    log_group_name = logs_info_df.loc[logs_info_df['feature']==feature, 'log_group'].values[0]
-    log_stream_name = logs_info_df.loc[logs_info_df['feature']==feature, 'latest_stream'].values[0]
+    log_group_name = logs_info_df.at[feature, 'log_group']
+    log_stream_name = logs_info_df.at[feature, 'latest_stream']
 
     # Retrieve log events for the selected log group and stream
     log_err, events = get_events(cloudwatch, log_group_name, log_stream_name)
@@ -28,6 +28,10 @@ class CognitoUser():
         self.client_id = client_id
         self.region = region
 
+        # Create the Cognito client once; boto3 client construction is
+        # expensive and the client is safe to reuse across method calls
+        self._client = boto3.client('cognito-idp', region_name=region)
+
     def print_attributes(self):
         """
         Print the attributes of the Cognito user, including user pool ID, client ID, and region.
@@ -53,8 +57,8 @@ class CognitoUser():
             ClientError: If authentication fails due to an error in the Cognito API.
         """
 
-        # Create a Cognito session
-        client = boto3.client('cognito-idp', region_name=self.region)
+        # Reuse the Cognito client created in __init__
+        client = self._client
         
         try:
             # Authenticate the user with Cognito
@@ -89,7 +93,7 @@ class CognitoUser():
             ClientError: If there is an error in the Cognito authentication process.
         """
 
-        client = boto3.client('cognito-idp', region_name=self.region)
+        client = self._client
 
         try:
             # Try to authenticate the user with USER_PASSWORD_AUTH flow
@@ -146,7 +150,7 @@ class CognitoUser():
             ClientError: If there is an error initiating the password reset process.
         """
 
-        client = boto3.client('cognito-idp', region_name=self.region)
+        client = self._client
         
         try:
             # Start the password reset flow
@@ -174,7 +178,7 @@ class CognitoUser():
             ClientError: If there is an error confirming the password reset.
         """
 
-        client = boto3.client('cognito-idp', region_name=self.region)
+        client = self._client
         
         try:
             # Confirm the password reset with the confirmation code
@@ -1,8 +1,26 @@
-import pandas as pd
+from __future__ import annotations
+
+import functools
+import os.path
 import json
-from io import BytesIO, StringIO
-from typing import Optional
+from io import BytesIO
+from typing import TYPE_CHECKING, Optional
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+
+# pandas is only imported lazily at runtime; make it available to type
+# checkers and annotation introspection (e.g. typing.get_type_hints)
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Maximum number of concurrent S3 requests
+# Must not exceed the max_pool_connections of the botocore client config
+MAX_WORKERS = 32
+
+# Minimum common-prefix length for s3_object_sizes_df to size keys with a
+# single listing; a shorter prefix would enumerate most of the bucket, which
+# costs more than one head_object request per key
+MIN_COMMON_PREFIX = 3
 
 def s3_list_objects(s3_client, bucket_name, folder_name, list_dirs=False) -> list:
     """
@@ -33,28 +51,52 @@ def s3_list_objects(s3_client, bucket_name, folder_name, list_dirs=False) -> lis
         >>>     print(obj_key)
     """
 
-    # List objects within the specified folder
-    response = s3_client.list_objects_v2(Bucket=bucket_name, Prefix=folder_name)
-
-    # Create an empty list for the object keys
-    keys = []
-
-    # Check if there are contents and print them
-    if 'Contents' in response:
-        for obj in response['Contents']:
-            # Add any object with an end key different from /
-            if obj['Key'][-1] != '/':
-                keys.append(obj['Key'])
-            
-            # Otherwise only include the object of the directories must be listed
-            elif list_dirs:
-                keys.append(obj['Key'])
-                
-    else:
+    # List objects within the specified folder, handling pagination so folders
+    # with more than 1000 objects are listed in full
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=folder_name)
+
+    # Collect the object keys, excluding directory keys (ending in /) unless
+    # the directories must be listed
+    keys = [
+        obj['Key']
+        for page in pages
+        for obj in page.get('Contents', ())
+        if list_dirs or obj['Key'][-1] != '/'
+    ]
+
+    if not keys:
         print("No objects found in the folder.")
 
     return keys
 
+@functools.lru_cache(maxsize=4096)
+def _head_content_length(s3_client, bucket_name, object_name) -> Optional[int]:
+    """
+    Retrieve the size in bytes of an object in an S3 bucket, with caching.
+
+    This helper wraps the `head_object` request in an LRU cache so repeated
+    size lookups for the same object skip the network round-trip. The client
+    is part of the cache key (by identity), so different clients do not share
+    entries. Unit conversion is done by the caller to keep cache entries small.
+
+    Args:
+        s3_client (boto3.client): A Boto3 S3 client instance used to interact with the S3 service.
+        bucket_name (str): The name of the S3 bucket containing the object.
+        object_name (str): The key (path) to the object within the S3 bucket.
+
+    Returns:
+        int or None: The size of the S3 object in bytes, or `None` if the size
+        information is unavailable.
+    """
+
+    response = s3_client.head_object(Bucket=bucket_name, Key=object_name)
+
+    if 'ContentLength' in response:
+        return response['ContentLength']
+    else:
+        return None
+
 def s3_object_size(s3_client, bucket_name, object_name, units='MB')  -> Optional[float]:
     """
     Retrieve the size of an object in an S3 bucket, with optional unit conversion.
@@ -84,13 +126,9 @@ def s3_object_size(s3_client, bucket_name, object_name, units='MB')  -> Optional
         >>> print(f"Size: {size_in_mb} MB")
     """
 
-    # Get object information
-    response = s3_client.head_object(Bucket=bucket_name, Key=object_name)
-
-    if 'ContentLength' in response:
-        object_size = response['ContentLength']
-    else:
-        object_size = None
+    # Get the object size in bytes; repeat calls for the same object are
+    # served from the cache instead of a new head_object round-trip
+    object_size = _head_content_length(s3_client, bucket_name, object_name)
 
     # Convert to the appropriate unit
     # If the unit is not supported, bytes are used
@@ -101,6 +139,34 @@ def s3_object_size(s3_client, bucket_name, object_name, units='MB')  -> Optional
 
     return object_size
 
+# Allow callers that mutate the bucket to invalidate the cached sizes
+s3_object_size.cache_clear = _head_content_length.cache_clear
+
+def _list_object_sizes(s3_client, bucket_name, prefix) -> dict:
+    """
+    Map the keys of all objects under a prefix to their size in bytes.
+
+    This helper paginates a single `list_objects_v2` call, which already returns
+    each object's size, so no per-object `head_object` round-trips are needed.
+
+    Args:
+        s3_client (boto3.client): A Boto3 S3 client instance used to interact with the S3 service.
+        bucket_name (str): The name of the S3 bucket containing the objects.
+        prefix (str): The common key prefix to list objects under.
+
+    Returns:
+        dict: A mapping of object key (str) to object size in bytes (int).
+    """
+
+    paginator = s3_client.get_paginator('list_objects_v2')
+    pages = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+
+    return {
+        obj['Key']: obj['Size']
+        for page in pages
+        for obj in page.get('Contents', ())
+    }
+
 def s3_object_sizes_df(s3_client, bucket_name, object_list) -> pd.DataFrame:
     """
     Create a DataFrame containing the sizes of specified objects in an S3 bucket.
@@ -128,13 +194,41 @@ def s3_object_sizes_df(s3_client, bucket_name, object_list) -> pd.DataFrame:
         >>> print(df)
     """
 
+    import pandas as pd
+
+    # Return an empty DataFrame without any API calls for an empty key list
+    if not object_list:
+        return pd.DataFrame(columns=['key', 'size_MB'])
+
+    # List all sizes under the keys' common prefix in one paginated request
+    # instead of one head_object round-trip per key; skip the listing when the
+    # keys share no meaningful prefix, leaving all keys to the head_object path
+    common_prefix = os.path.commonprefix(object_list)
+    if len(common_prefix) >= MIN_COMMON_PREFIX:
+        sizes = _list_object_sizes(s3_client, bucket_name, common_prefix)
+    else:
+        sizes = {}
+
+    # Convert the listed sizes from bytes to MB
+    sizes_mb = {obj: sizes[obj]/(1024*1024) for obj in object_list if obj in sizes}
+
+    # Size the remaining keys (disjoint prefixes, or a listing that was
+    # skipped entirely) with concurrent head_object requests; the boto3 client
+    # is safe to share across threads
+    missing = [obj for obj in object_list if obj not in sizes_mb]
+    if missing:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            head_sizes = executor.map(
+                lambda obj: s3_object_size(s3_client, bucket_name, obj),
+                missing
+            )
+            sizes_mb.update(zip(missing, head_sizes))
+
     # Create a DataFrame of objects with their size
-    object_sizes = []
-    for obj in object_list:
-        object_sizes.append({
-            'key': obj,
-            'size_MB': round(s3_object_size(s3_client, bucket_name, obj), 2)
-        })
+    object_sizes = [
+        {'key': obj, 'size_MB': round(sizes_mb[obj], 2)}
+        for obj in object_list
+    ]
 
     return pd.DataFrame(object_sizes)
 
@@ -166,9 +260,9 @@ def s3_read_json(s3_client, bucket_name, object_key) -> dict:
     # Get the object from S3
     response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
 
-    # Read the object content using BytesIO
-    file_content = response['Body'].read()
-    return json.load(BytesIO(file_content))
+    # Parse directly from the streaming body so decoding overlaps the download
+    # and the file is never buffered in memory twice
+    return json.load(response['Body'])
 
 def s3_upload_json(s3_client, bucket_name, object_key, dict_data):
     """
@@ -195,26 +289,39 @@ def s3_upload_json(s3_client, bucket_name, object_key, dict_data):
         >>> s3_load_json(s3_client, 'my-bucket', 'path/to/file.json', data)
     """
     
-    # Format the JSON data
-    json_data = json.dumps(dict_data)
-    
-    # Add the file to S3
-    s3_client.put_object(Bucket=bucket_name, Key=object_key, Body=json_data, ContentType='application/json')
-
-def s3_read_csv(s3_client, bucket_name, object_key):
+    # Format the JSON data as bytes
+    json_buffer = BytesIO(json.dumps(dict_data).encode('utf-8'))
+
+    # Add the file to S3; upload_fileobj uses the multithreaded multipart
+    # transfer engine for large payloads
+    s3_client.upload_fileobj(
+        json_buffer,
+        bucket_name,
+        object_key,
+        ExtraArgs={'ContentType': 'application/json'}
+    )
+
+def s3_read_csv(s3_client, bucket_name, object_key, chunksize=None):
     """
     Load a CSV file from an S3 bucket into a Pandas DataFrame.
 
     This function retrieves a CSV file from an S3 bucket and loads its contents
-    into a Pandas DataFrame for easy data manipulation and analysis.
+    into a Pandas DataFrame for easy data manipulation and analysis. The file is
+    parsed directly from the streaming S3 body so it is never buffered in memory
+    in full before parsing.
 
     Args:
         s3_client (boto3.client): A Boto3 S3 client instance used to interact with the S3 service.
         bucket_name (str): The name of the S3 bucket containing the CSV file.
         object_key (str): The key (path) of the CSV file within the S3 bucket.
+        chunksize (int, optional): If set, return an iterator of DataFrames of
+            `chunksize` rows instead of a single DataFrame, so very large files
+            can be processed without holding them in memory at once. Callers
+            can `pd.concat` the chunks once at the end if needed. Defaults to `None`.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the data from the CSV file.
+        pandas.DataFrame: A DataFrame containing the data from the CSV file, or
+        an iterator of DataFrames if `chunksize` is set.
 
     Raises:
         botocore.exceptions.ClientError: If there is an issue accessing the CSV file in S3.
@@ -226,15 +333,59 @@ def s3_read_csv(s3_client, bucket_name, object_key):
         >>> print(df.head())
     """
 
-    # Get the CSV file from S3 as bytes
+    import pandas as pd
+
+    # Get the CSV file from S3
     response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-    file_content = response['Body'].read()
 
-    # Load the CSV file into a pandas DataFrame
-    csv_buffer = BytesIO(file_content)
-    df = pd.read_csv(csv_buffer)
+    # Chunked reads are only supported by the default C engine
+    if chunksize is not None:
+        return pd.read_csv(response['Body'], chunksize=chunksize)
 
-    return df
+    # Parse with the multithreaded pyarrow engine when available, falling back
+    # to the default C engine otherwise
+    try:
+        import pyarrow  # noqa: F401
+        engine_kwargs = {'engine': 'pyarrow', 'dtype_backend': 'pyarrow'}
+    except ImportError:
+        engine_kwargs = {}
+
+    # Load the CSV file into a pandas DataFrame from the streaming body so
+    # parsing overlaps the download
+    return pd.read_csv(response['Body'], **engine_kwargs)
+
+def s3_read_csv_table(s3_client, bucket_name, object_key):
+    """
+    Load a CSV file from an S3 bucket into a pyarrow Table.
+
+    This function retrieves a CSV file from an S3 bucket and parses it with
+    pyarrow's multithreaded CSV reader, returning the raw columnar Table with
+    no pandas conversion overhead. Use it for callers that only need a
+    columnar scan of the data.
+
+    Args:
+        s3_client (boto3.client): A Boto3 S3 client instance used to interact with the S3 service.
+        bucket_name (str): The name of the S3 bucket containing the CSV file.
+        object_key (str): The key (path) of the CSV file within the S3 bucket.
+
+    Returns:
+        pyarrow.Table: A Table containing the data from the CSV file.
+
+    Raises:
+        ImportError: If pyarrow is not installed.
+        botocore.exceptions.ClientError: If there is an issue accessing the CSV file in S3.
+
+    Example:
+        >>> s3_client = boto3.client('s3')
+        >>> table = s3_read_csv_table(s3_client, 'my-bucket', 'path/to/file.csv')
+        >>> print(table.num_rows)
+    """
+
+    import pyarrow.csv
+
+    # Get the CSV file from S3 and parse the streaming body into a Table
+    response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+    return pyarrow.csv.read_csv(response['Body'])
 
 
 def s3_upload_csv(s3_client, bucket_name, object_key, dataframe):
@@ -262,37 +413,51 @@ def s3_upload_csv(s3_client, bucket_name, object_key, dataframe):
         >>> s3_upload_csv(s3_client, 'my-bucket', 'path/to/file.csv', df)
     """
     
-    # Convert DataFrame to CSV format and store it in a buffer
-    csv_buffer = StringIO()
-    dataframe.to_csv(csv_buffer, index=False)
-    
-    # Upload CSV data to S3
+    # Convert DataFrame to CSV format and store it in a bytes buffer so no
+    # str-to-bytes encoding copy is needed at upload time
+    csv_buffer = BytesIO()
+    dataframe.to_csv(csv_buffer, index=False, encoding='utf-8')
+    csv_buffer.seek(0)
+
+    # Upload CSV data to S3; upload_fileobj uses the multithreaded multipart
+    # transfer engine for large payloads
     try:
-        s3_client.put_object(
-            Bucket=bucket_name,
-            Key=object_key,
-            Body=csv_buffer.getvalue(),
-            ContentType='text/csv'
+        s3_client.upload_fileobj(
+            csv_buffer,
+            bucket_name,
+            object_key,
+            ExtraArgs={'ContentType': 'text/csv'}
         )
     except ClientError as e:
         print(f"Error occurred: {e.response['Error']['Message']}")
 
 
-def s3_read_json_to_df(s3_client, bucket_name, object_key):
+def s3_read_json_to_df(s3_client, bucket_name, object_key, orient='records', lines=False, chunksize=None):
     """
     Load a JSON file from an S3 bucket into a Pandas DataFrame.
 
-    This function retrieves a JSON file from an S3 bucket using the `s3_read_json` function, 
-    and loads its contents into a Pandas DataFrame. It is expected that the JSON file's 
-    structure aligns with a table format that can be represented as a DataFrame.
+    This function retrieves a JSON file from an S3 bucket and parses it with
+    `pd.read_json` directly from the streaming S3 body, building the columnar
+    data in a single pass without materializing an intermediate dictionary.
+    It is expected that the JSON file's structure aligns with a table format
+    that can be represented as a DataFrame.
 
     Args:
         s3_client (boto3.client): A Boto3 S3 client instance used to interact with the S3 service.
         bucket_name (str): The name of the S3 bucket containing the JSON file.
         object_key (str): The key (path) of the JSON file within the S3 bucket.
+        orient (str, optional): The expected JSON string format, passed to
+            `pd.read_json`. Defaults to 'records'.
+        lines (bool, optional): If `True`, read the file as JSON lines (one
+            object per line). Defaults to `False`.
+        chunksize (int, optional): If set (requires `lines=True`), return an
+            iterator of DataFrames of `chunksize` rows instead of a single
+            DataFrame; callers can `pd.concat` the chunks once at the end.
+            Defaults to `None`.
 
     Returns:
-        pandas.DataFrame: A DataFrame containing the data from the JSON file.
+        pandas.DataFrame: A DataFrame containing the data from the JSON file, or
+        an iterator of DataFrames if `chunksize` is set.
 
     Raises:
         botocore.exceptions.ClientError: If there is an issue accessing the JSON file in S3.
@@ -303,13 +468,15 @@ def s3_read_json_to_df(s3_client, bucket_name, object_key):
         >>> df = s3_read_json_to_df(s3_client, 'my-bucket', 'path/to/file.json')
         >>> print(df.head())
     """
-    
-    # Read JSON content from S3
-    json_data = s3_read_json(s3_client, bucket_name, object_key)
-    
-    # Load JSON content into a DataFrame
+
+    import pandas as pd
+
+    # Get the object from S3
+    response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+
+    # Load the JSON content into a DataFrame from the streaming body
     try:
-        df = pd.DataFrame(json_data)
+        df = pd.read_json(response['Body'], orient=orient, lines=lines, chunksize=chunksize)
     except ValueError as e:
         print("Error converting JSON to DataFrame:", e)
         raise
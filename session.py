@@ -1,22 +1,88 @@
+import functools
+
 import boto3
+from botocore.config import Config
 
 # Global variables
 REGION_NAME = 'ap-southeast-2'
 
-def initiate_session(access_key='', secret_key='', region_name=REGION_NAME):
+# Shared client configuration
+# max_pool_connections must be at least as large as any ThreadPoolExecutor
+# max_workers used with these clients, so every thread reuses a warm connection
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={'mode': 'adaptive'},
+    tcp_keepalive=True
+)
+
+@functools.lru_cache(maxsize=4)
+def _initiate_session(access_key, secret_key, region_name):
+    """
+    Build the session and service clients for already-resolved credentials.
+
+    This inner function carries the memoization: it is keyed on the resolved
+    credentials, so repeated calls in the same process reuse the constructed
+    clients and their warm connection pools, while prompting stays outside the
+    cache and interactive callers are always re-prompted after a typo.
+    """
+
+    if access_key != '' and secret_key != '':
+        # Set up a boto3 session with explicit credentials
+        session = boto3.Session(
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+            region_name=region_name
+        )
+    elif access_key != '' or secret_key != '':
+        # Fail early on half-provided credentials rather than letting the
+        # session fail later with an opaque signing error
+        raise ValueError(
+            "Provide both access_key and secret_key, or neither to use the "
+            "credential-provider chain."
+        )
+    else:
+        # Let botocore's credential-provider chain resolve the credentials
+        # (env -> shared config/SSO -> EC2 instance metadata)
+        session = boto3.Session(region_name=region_name)
+
+    # Apply the shared client configuration once on the underlying botocore
+    # session so every client created from it inherits the connection pool
+    # without re-resolving the config per client
+    session._session.set_default_client_config(CLIENT_CONFIG)
+
+    # Initialise the boto3 clients off the one shared botocore session
+    clients = {
+        'cognito': session.client('cognito-idp', region_name=region_name),
+        's3': session.client('s3', region_name=region_name),
+        'cloudwatch': session.client('logs', region_name=region_name)
+    }
+
+    return clients
+
+def initiate_session(access_key='', secret_key='', region_name=REGION_NAME, interactive=False):
     """
     Initialize a Boto3 session and set up AWS service clients.
 
-    This function initializes an AWS session using explicit credentials and returns 
-    clients for commonly used AWS services, including Cognito, S3, and CloudWatch logs.
+    Results are memoized per resolved credentials and region, so repeated calls
+    in the same process reuse the already-constructed clients and their warm
+    connection pools instead of paying the client construction cost again. Use
+    `initiate_session.cache_clear()` to force new sessions.
+
+    This function initializes an AWS session and returns clients for commonly used
+    AWS services, including Cognito, S3, and CloudWatch logs. When no explicit
+    credentials are provided, botocore's credential-provider chain (environment
+    variables, shared config/SSO, EC2 instance metadata) is used, which avoids
+    blocking on user input and passing plaintext secrets through Python strings.
 
     Args:
-        access_key (str, optional): The AWS access key ID. If not provided, the function prompts 
-            for input. Defaults to an empty string.
-        secret_key (str, optional): The AWS secret access key. If not provided, the function prompts 
-            for input. Defaults to an empty string.
-        region_name (str): The AWS region for the session and clients. Defaults to the value 
+        access_key (str, optional): The AWS access key ID. If not provided, the session
+            falls back to the credential-provider chain. Defaults to an empty string.
+        secret_key (str, optional): The AWS secret access key. If not provided, the session
+            falls back to the credential-provider chain. Defaults to an empty string.
+        region_name (str): The AWS region for the session and clients. Defaults to the value
             of `REGION_NAME`.
+        interactive (bool, optional): If `True`, prompt for any missing credentials instead
+            of using the credential-provider chain. Defaults to `False`.
 
     Returns:
         dict: A dictionary with initialized Boto3 clients for the following services:
@@ -25,6 +91,7 @@ def initiate_session(access_key='', secret_key='', region_name=REGION_NAME):
             - 'cloudwatch' (boto3.client): Client for Amazon CloudWatch Logs.
 
     Raises:
+        ValueError: If only one of `access_key` and `secret_key` is provided.
         botocore.exceptions.NoCredentialsError: If credentials are missing or invalid.
 
     Example:
@@ -33,26 +100,17 @@ def initiate_session(access_key='', secret_key='', region_name=REGION_NAME):
         >>> s3_client = clients['s3']
     """
 
-    # Manually enter credentials if not provided
-    if access_key == '':
-        access_key = input("AWS Access Key: ")
-    
-    if secret_key == '':
-        secret_key = input("AWS Secret Access Key: ")
-
-    # Set up a boto3 session with explicit credentials
-    session = boto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name=region_name
-    )
-
-    # Initialise boto3 client for cognito
-    clients = {
-        'cognito': session.client('cognito-idp', region_name=region_name),
-        's3': session.client('s3', region_name=region_name),
-        'cloudwatch': session.client('logs', region_name=region_name)
-    }
+    # Manually enter credentials if requested and not provided; prompting
+    # happens outside the cache so a mistyped entry is never memoized
+    if interactive:
+        if access_key == '':
+            access_key = input("AWS Access Key: ")
 
-    return clients
+        if secret_key == '':
+            secret_key = input("AWS Secret Access Key: ")
+
+    return _initiate_session(access_key, secret_key, region_name)
+
+# Allow callers to invalidate the memoized sessions
+initiate_session.cache_clear = _initiate_session.cache_clear
     
\ No newline at end of file